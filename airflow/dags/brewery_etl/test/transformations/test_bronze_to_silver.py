@@ -1,10 +1,12 @@
 """Tests for the bronze_to_silver function."""
 
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import patch, MagicMock
 
 import pandas as pd
-from brewery_etl.transformations.bronze_to_silver import bronze_to_silver
+import pyarrow as pa
+from deltalake import DeltaTable, write_deltalake
+from brewery_etl.transformations.bronze_to_silver import bronze_to_silver, _load_bronze_data
 
 class TestBronzeToSilver:
     """Test suite for the bronze_to_silver function."""
@@ -47,3 +49,86 @@ class TestBronzeToSilver:
         mock_add_metadata.assert_called_once()
         mock_write.assert_called_once()
         assert mock_context.register_metric.call_count == 3
+
+    @patch("brewery_etl.transformations.bronze_to_silver.ETLMetricsContext")
+    def test_bronze_to_silver_merges_latest_records(self, mock_metrics, tmp_path):
+        """Test that incremental runs de-duplicate bronze, merge into silver and can be rerun."""
+        mock_metrics.return_value.__enter__.return_value = MagicMock()
+        bronze_path = str(tmp_path / "bronze")
+        silver_path = str(tmp_path / "silver")
+
+        quarantine_path = str(tmp_path / "quarantine")
+
+        def bronze_batch(ids, names, ingested_at, states=None):
+            return pa.table({
+                "id": ids,
+                "name": names,
+                "brewery_type": ["micro"] * len(ids),
+                "state": states or ["tx"] * len(ids),
+                "city": ["austin"] * len(ids),
+                "country": ["united states"] * len(ids),
+                "website_url": ["example.com"] * len(ids),
+                "ingestion_timestamp": pa.array([ingested_at] * len(ids), type=pa.timestamp("us")),
+                "ingestion_date": pa.array([ingested_at.date()] * len(ids), type=pa.date32())
+            })
+
+        write_deltalake(bronze_path, bronze_batch(["1", "2"], ["Old1", "Old2"], datetime(2025, 6, 9, 1)),
+                        partition_by=["ingestion_date"])
+        with patch("brewery_etl.transformations.bronze_to_silver.BRONZE_PATH", bronze_path), \
+                patch("brewery_etl.transformations.bronze_to_silver.SILVER_PATH", silver_path), \
+                patch("brewery_etl.transformations.bronze_to_silver.QUARANTINE_PATH", quarantine_path):
+            bronze_to_silver(logical_date=datetime(2025, 6, 9))
+
+            write_deltalake(bronze_path, bronze_batch(["2", "3", "4"], ["Early2", "Early3", "NoState4"],
+                                                      datetime(2025, 6, 10, 1), ["tx", "tx", None]),
+                            mode="append")
+            write_deltalake(bronze_path, bronze_batch(["2"], ["New2"], datetime(2025, 6, 10, 2)), mode="append")
+            bronze_to_silver(logical_date=datetime(2025, 6, 10))
+            bronze_to_silver(logical_date=datetime(2025, 6, 10))
+
+        silver = DeltaTable(silver_path).to_pandas().sort_values("id")
+        assert silver["id"].tolist() == ["1", "2", "3"]
+        assert silver["name"].tolist() == ["Old1", "New2", "Early3"]
+        assert silver["location"].unique().tolist() == ["UNITED STATES"]
+        assert DeltaTable(quarantine_path).to_pandas()["id"].tolist() == ["4"]
+        assert "__index_level_0__" not in DeltaTable(quarantine_path).schema().to_arrow().names
+
+    @patch("brewery_etl.transformations.bronze_to_silver.ETLMetricsContext")
+    def test_bronze_to_silver_full_refresh_replaces_quarantine(self, mock_metrics, tmp_path):
+        """Test that a full refresh rewrites the quarantine table instead of appending to it."""
+        mock_metrics.return_value.__enter__.return_value = MagicMock()
+        bronze_path = str(tmp_path / "bronze")
+        quarantine_path = str(tmp_path / "quarantine")
+
+        ingested_at = datetime(2025, 6, 9, 1)
+        write_deltalake(bronze_path, pa.table({
+            "id": ["1", "2", "3"],
+            "brewery_type": ["micro", "micro", None],
+            "state": ["tx", None, "tx"],
+            "city": ["austin"] * 3,
+            "country": ["united states"] * 3,
+            "ingestion_timestamp": pa.array([ingested_at] * 3, type=pa.timestamp("us")),
+            "ingestion_date": pa.array([ingested_at.date()] * 3, type=pa.date32())
+        }), partition_by=["ingestion_date"])
+
+        with patch("brewery_etl.transformations.bronze_to_silver.BRONZE_PATH", bronze_path), \
+                patch("brewery_etl.transformations.bronze_to_silver.SILVER_PATH", str(tmp_path / "silver")), \
+                patch("brewery_etl.transformations.bronze_to_silver.QUARANTINE_PATH", quarantine_path):
+            bronze_to_silver(logical_date=datetime(2025, 6, 9))
+            bronze_to_silver(logical_date=datetime(2025, 6, 9))
+            bronze_to_silver(logical_date=datetime(2025, 6, 9), params={"full_refresh": True})
+            bronze_to_silver()
+
+        assert sorted(DeltaTable(quarantine_path).to_pandas()["id"].tolist()) == ["2", "3"]
+
+    def test_load_bronze_data_reads_unpartitioned_table(self, tmp_path):
+        """Test that a bronze table without ingestion_date partitions is read in full."""
+        bronze_path = str(tmp_path / "bronze")
+        write_deltalake(bronze_path, pd.DataFrame({
+            "id": ["1"], "brewery_type": ["micro"], "state": ["TX"], "city": ["Austin"], "country": ["US"]
+        }))
+
+        with patch("brewery_etl.transformations.bronze_to_silver.BRONZE_PATH", bronze_path):
+            df = _load_bronze_data(MagicMock(), date(2025, 6, 9))
+
+        assert df["id"].tolist() == ["1"]
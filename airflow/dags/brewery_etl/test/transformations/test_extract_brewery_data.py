@@ -3,7 +3,10 @@
 from unittest.mock import patch, MagicMock
 from datetime import datetime
 
-from brewery_etl.transformations.extract_brewery_data import extract_brewery_data
+import pytest
+import requests
+
+from brewery_etl.transformations.extract_brewery_data import extract_brewery_data, _extract_paginated_data
 
 
 class TestExtractBreweryData:
@@ -25,3 +28,64 @@ class TestExtractBreweryData:
         mock_extract.assert_called_once()
         assert result == ["file1.json", "file2.json"]
         assert mock_context.register_metric.call_count == 4
+
+    @patch("brewery_etl.transformations.extract_brewery_data.API_MIN_REQUEST_INTERVAL", 0)
+    @patch("brewery_etl.transformations.extract_brewery_data.API_PER_PAGE_LIMIT", 2)
+    @patch("brewery_etl.transformations.extract_brewery_data.save_json_data")
+    @patch("brewery_etl.transformations.extract_brewery_data.make_api_request")
+    def test_extract_paginated_data_stops_at_short_page(self, mock_request, mock_save):
+        """Test that speculative pagination, used when the metadata probe fails, stops at the first short page."""
+        pages = {1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}], 3: [{"id": 5}]}
+
+        requested_urls = []
+
+        def fake_request(url, params, metrics, **kwargs):
+            requested_urls.append(url)
+            if url.endswith("/meta"):
+                raise requests.exceptions.ConnectionError("metadata endpoint unavailable")
+            response = MagicMock()
+            response.json.return_value = pages.get(params["page"], [])
+            return response
+
+        mock_request.side_effect = fake_request
+        mock_save.return_value = 10
+        pages_total = MagicMock()
+
+        result = _extract_paginated_data(MagicMock(), "20250609_000000", pages_total, MagicMock(),
+                                         MagicMock(), MagicMock())
+
+        assert requested_urls[0].endswith("/meta")
+        assert [f.rsplit("_", 1)[-1] for f in result] == ["page1.json", "page2.json", "page3.json"]
+        assert mock_save.call_count == 3
+        pages_total.set.assert_called_once_with(3)
+
+    @pytest.mark.parametrize("reported_total", [5, 4])
+    @patch("brewery_etl.transformations.extract_brewery_data.API_MIN_REQUEST_INTERVAL", 0)
+    @patch("brewery_etl.transformations.extract_brewery_data.API_PER_PAGE_LIMIT", 2)
+    @patch("brewery_etl.transformations.extract_brewery_data.save_json_data")
+    @patch("brewery_etl.transformations.extract_brewery_data.make_api_request")
+    def test_extract_paginated_data_uses_reported_total(self, mock_request, mock_save, reported_total):
+        """Test that the reported total bounds pagination unless its last page comes back full."""
+        pages = {1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}], 3: [{"id": 5}]}
+        requested_pages = []
+
+        def fake_request(url, params, metrics, **kwargs):
+            response = MagicMock()
+            if url.endswith("/meta"):
+                response.json.return_value = {"total": str(reported_total)}
+            else:
+                requested_pages.append(params["page"])
+                response.json.return_value = pages.get(params["page"], [])
+            return response
+
+        mock_request.side_effect = fake_request
+        mock_save.return_value = 10
+
+        result = _extract_paginated_data(MagicMock(), "20250609_000000", MagicMock(), MagicMock(),
+                                         MagicMock(), MagicMock())
+
+        assert [f.rsplit("_", 1)[-1] for f in result] == ["page1.json", "page2.json", "page3.json"]
+        if reported_total == 5:
+            assert sorted(requested_pages) == [1, 2, 3]
+        else:
+            assert 3 in requested_pages
@@ -1,10 +1,11 @@
 """Tests for the landing_to_bronze function."""
 
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import patch, MagicMock
 
-import pandas as pd
-from brewery_etl.transformations.landing_to_bronze import landing_to_bronze
+import pyarrow as pa
+from deltalake import DeltaTable, write_deltalake
+from brewery_etl.transformations.landing_to_bronze import landing_to_bronze, _write_to_bronze
 
 class TestLandingToBronze:
     """Test suite for the landing_to_bronze function."""
@@ -21,9 +22,9 @@ class TestLandingToBronze:
         mock_context = MagicMock()
         mock_metrics.return_value.__enter__.return_value = mock_context
         mock_get_files.return_value = ["file1.json", "file2.json"]
-        mock_process.return_value = ([{"id": 1, "name": "Brewery1"},
-                                    {"id": 2, "name": "Brewery2"}], 1000)
-        mock_add_metadata.return_value = pd.DataFrame({
+        mock_process.return_value = (pa.Table.from_pylist([{"id": 1, "name": "Brewery1"},
+                                                          {"id": 2, "name": "Brewery2"}]), 1000)
+        mock_add_metadata.return_value = pa.table({
             "id": [1, 2], 
             "name": ["Brewery1", "Brewery2"],
             "ingestion_timestamp": ["2025-06-09", "2025-06-09"]
@@ -38,3 +39,29 @@ class TestLandingToBronze:
         mock_write.assert_called_once()
 
         assert mock_context.register_metric.call_count == 3
+
+    def test_write_to_bronze_repartitions_legacy_table_then_replaces_partition(self, tmp_path):
+        """Test that a legacy bronze table is overwritten once and later writes replace only their date."""
+        bronze_path = str(tmp_path / "bronze")
+        write_deltalake(bronze_path, pa.table({"id": ["old"], "name": ["Legacy"]}))
+
+        def batch(ids, ingestion_date):
+            return pa.table({
+                "id": ids,
+                "name": [f"Brewery{i}" for i in ids],
+                "ingestion_date": pa.array([ingestion_date] * len(ids), type=pa.date32())
+            })
+
+        def bronze_ids():
+            return sorted(DeltaTable(bronze_path).to_pyarrow_table()["id"].to_pylist())
+
+        with patch("brewery_etl.transformations.landing_to_bronze.BRONZE_PATH", bronze_path):
+            _write_to_bronze(batch(["1", "2"], date(2025, 6, 9)), MagicMock(), MagicMock(), date(2025, 6, 9))
+            assert DeltaTable(bronze_path).metadata().partition_columns == ["ingestion_date"]
+            assert bronze_ids() == ["1", "2"]
+
+            _write_to_bronze(batch(["3"], date(2025, 6, 10)), MagicMock(), MagicMock(), date(2025, 6, 10))
+            assert bronze_ids() == ["1", "2", "3"]
+
+            _write_to_bronze(batch(["3", "4"], date(2025, 6, 10)), MagicMock(), MagicMock(), date(2025, 6, 10))
+            assert bronze_ids() == ["1", "2", "3", "4"]
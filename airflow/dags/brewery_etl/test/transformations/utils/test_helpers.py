@@ -0,0 +1,63 @@
+"""Tests for the ETL helper functions."""
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from brewery_etl.transformations.utils.helpers import create_aggregation, read_json_table, save_json_data
+
+
+class TestCreateAggregation:
+    """Test suite for the create_aggregation function."""
+
+    @pytest.mark.parametrize("engine", ["numpy", "numba", "cython"])
+    @pytest.mark.parametrize("dtype", [object, pd.ArrowDtype(pa.string())])
+    def test_create_aggregation_matches_groupby_size(self, dtype, engine):
+        """Test that every engine matches pandas groupby().size()."""
+        df = pd.DataFrame({
+            "brewery_type": ["micro", "nano", "micro", "micro", None, "brewpub"],
+            "state": ["TX", "CO", "TX", "OR", "TX", None],
+            "city": ["AUSTIN", "DENVER", "AUSTIN", "PORTLAND", "AUSTIN", "DENVER"]
+        }).astype(dtype)
+        group_by_columns = ["brewery_type", "state", "city"]
+
+        result = create_aggregation(df, group_by_columns, "brewery_count", engine=engine)
+        expected = df.groupby(group_by_columns).size().reset_index(name="brewery_count")
+
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestReadJsonTable:
+    """Test suite for the read_json_table function."""
+
+    def test_save_json_data_round_trips_through_read_json_table(self, tmp_path):
+        """Test that pages saved as NDJSON read back with fields missing from some records."""
+        file_path = str(tmp_path / "breweries_page1.json")
+        records = [
+            {"id": "1", "name": "Brewery1", "longitude": -97.1},
+            {"id": "2", "name": "Brewery2"},
+            {"id": "3", "name": "Brewery3", "longitude": None, "phone": "555"}
+        ]
+
+        file_size = save_json_data(records, file_path)
+        table = read_json_table(file_path)
+
+        assert file_size == (tmp_path / "breweries_page1.json").stat().st_size
+        assert (tmp_path / "breweries_page1.json").read_bytes().count(b"\n") == len(records)
+        assert table.to_pylist() == [
+            {"id": "1", "name": "Brewery1", "longitude": -97.1, "phone": None},
+            {"id": "2", "name": "Brewery2", "longitude": None, "phone": None},
+            {"id": "3", "name": "Brewery3", "longitude": None, "phone": "555"}
+        ]
+
+    def test_read_json_table_array_file_keeps_all_fields(self, tmp_path):
+        """Test that a JSON array file keeps fields missing from its first record."""
+        file_path = tmp_path / "breweries_page1.json"
+        file_path.write_text('[{"id": "1", "name": "Brewery1"}, {"id": "2", "name": "Brewery2", "phone": "555"}]')
+
+        table = read_json_table(str(file_path))
+
+        assert table.to_pylist() == [
+            {"id": "1", "name": "Brewery1", "phone": None},
+            {"id": "2", "name": "Brewery2", "phone": "555"}
+        ]
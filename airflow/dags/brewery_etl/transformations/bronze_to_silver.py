@@ -1,23 +1,30 @@
 """Module for transforming data from bronze to silver layer."""
 
 import os
+import time
 import logging
-from typing import Any, Tuple
-from datetime import datetime
-from deltalake import DeltaTable
+from typing import Any, Optional, Tuple
+from datetime import date, datetime
+from deltalake import DeltaTable, WriterProperties
 from deltalake.writer import write_deltalake
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 
 from brewery_etl.transformations.utils.constants import (
-    BRONZE_PATH, QUARANTINE_PATH, SILVER_PATH, KEY_FIELDS, STRING_COLUMNS)
+    BRONZE_PATH, QUARANTINE_PATH, SILVER_PATH, KEY_FIELDS, STRING_COLUMNS, QUARANTINE_COMPACTION_MIN_FILES)
 from brewery_etl.transformations.utils.metrics import brewery_metrics, ETLMetricsContext
 from brewery_etl.transformations.utils.helpers import (
     standardize_brewery_types,
     standardize_website_urls,
+    check_duplicate_ids,
+    count_unique_values,
+    is_full_refresh,
     validate_schema,
     standardize_location_fields,
     add_processing_metadata,
-    calculate_directory_size,
+    get_logical_date,
+    calculate_delta_table_size,
     convert_string_columns
 )
 
@@ -57,7 +64,9 @@ def bronze_to_silver(**kwargs: Any) -> str:
         os.makedirs(QUARANTINE_PATH, exist_ok=True)
         os.makedirs(SILVER_PATH, exist_ok=True)
 
-        df = _load_bronze_data(metrics)
+        full_refresh = is_full_refresh(kwargs)
+        ingestion_date = None if full_refresh else get_logical_date(kwargs)
+        df = _load_bronze_data(metrics, ingestion_date)
 
         logger.info("Original DataFrame schema:")
         logger.info(df.dtypes)
@@ -65,26 +74,33 @@ def bronze_to_silver(**kwargs: Any) -> str:
         total_records = len(df)
         metrics.records_processed_total.labels(operation='silver').inc(total_records)
 
-        df = _remove_invalid_records(df, KEY_FIELDS, rows_discarded)
+        df = _remove_invalid_records(df, KEY_FIELDS, rows_discarded, ingestion_date)
 
-        transformation_start = datetime.now()
+        transformation_start = time.perf_counter_ns()
 
-        df = convert_string_columns(df, STRING_COLUMNS)
-        df = standardize_location_fields(df)
-        df = standardize_brewery_types(df)
-        df = standardize_website_urls(df)
-        df = add_processing_metadata(df)
+        with pd.option_context("mode.copy_on_write", True):
+            df = (
+                df.pipe(convert_string_columns, STRING_COLUMNS)
+                .pipe(standardize_location_fields)
+                .pipe(standardize_brewery_types)
+                .pipe(standardize_website_urls)
+                .pipe(add_processing_metadata)
+            )
 
-        transformation_duration = (datetime.now() - transformation_start).total_seconds()
+        transformation_duration = (time.perf_counter_ns() - transformation_start) / 1e9
         metrics.processing_duration_seconds.labels(
             operation='silver_transformation'
         ).observe(transformation_duration)
 
-        unique_locations = df['location'].nunique()
+        if check_duplicate_ids(df, metrics):
+            df = (df.sort_values('ingestion_timestamp', kind='stable')
+                  .drop_duplicates(subset='id', keep='last'))
+
+        unique_locations = count_unique_values(df['location'])
         partitions_created.set(unique_locations)
 
         if not df.empty:
-            _write_to_silver(df, metrics, delta_write_duration, len(df))
+            _write_to_silver(df, metrics, delta_write_duration, len(df), full_refresh)
             logger.info("Successfully processed data to silver layer")
         else:
             logger.warning("No valid records to write to silver layer after filtering")
@@ -92,12 +108,20 @@ def bronze_to_silver(**kwargs: Any) -> str:
         return SILVER_PATH
 
 
-def _load_bronze_data(metrics: Any) -> pd.DataFrame:
+def _load_bronze_data(metrics: Any, ingestion_date: Optional[date] = None) -> pd.DataFrame:
     """
     Load data from bronze layer with metrics tracking
 
+    The table is scanned through its Arrow dataset and converted to pandas with
+    self_destruct, so Arrow buffers are released column by column instead of
+    holding both copies of the bronze data in memory at once. Columns keep
+    Arrow-backed dtypes, so strings are not boxed into Python objects. When an
+    ingestion date is given and the table is partitioned by it, only that
+    ingestion_date partition is read.
+
     Args:
         metrics: Metrics context for tracking operations
+        ingestion_date: Ingestion date partition to read, or None to read everything
 
     Returns:
         DataFrame loaded from bronze layer
@@ -105,11 +129,20 @@ def _load_bronze_data(metrics: Any) -> pd.DataFrame:
     Raises:
         Exception: If loading fails
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     try:
-        df = DeltaTable(BRONZE_PATH).to_pandas()
-
-        bronze_read_duration = (datetime.now() - start_time).total_seconds()
+        bronze_table = DeltaTable(BRONZE_PATH)
+        partition_filter = None
+        if ingestion_date:
+            if 'ingestion_date' in bronze_table.metadata().partition_columns:
+                partition_filter = ds.field('ingestion_date') == ingestion_date
+            else:
+                logger.warning("Bronze table is not partitioned by ingestion_date, reading all of it")
+        table = bronze_table.to_pyarrow_dataset().to_table(filter=partition_filter)
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+        del table
+
+        bronze_read_duration = (time.perf_counter_ns() - start_time) / 1e9
         metrics.processing_duration_seconds.labels(
             operation='silver_bronze_read').observe(bronze_read_duration)
 
@@ -124,29 +157,50 @@ def _load_bronze_data(metrics: Any) -> pd.DataFrame:
         raise
 
 
-def _write_to_silver(df: pd.DataFrame, metrics: Any, duration_metric: Any, total_records: int) -> None:
+def _write_to_silver(df: pd.DataFrame, metrics: Any, duration_metric: Any, total_records: int,
+                     full_refresh: bool = False) -> None:
     """
     Write dataframe to silver layer with metrics tracking
 
+    The transformed frame is converted to Arrow exactly once here, without the
+    pandas index, which the quarantine split leaves non-contiguous and which
+    would otherwise be written as an extra __index_level_0__ column.
+
+    Records are merged into the existing table on id; the table is overwritten
+    only when a full refresh is requested or it does not exist yet.
+
     Args:
         df: DataFrame to write
         metrics: Metrics context for tracking operations
         duration_metric: Metric for tracking write duration
         total_records: Total number of records being written
+        full_refresh: Whether to overwrite the silver table instead of merging
 
     Raises:
         Exception: If writing fails
     """
-    delta_write_start = datetime.now()
+    delta_write_start = time.perf_counter_ns()
     try:
-        write_deltalake(SILVER_PATH, df, partition_by=["location"], mode="overwrite")
-
-        delta_write_duration_seconds = (datetime.now() - delta_write_start).total_seconds()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if full_refresh or not DeltaTable.is_deltatable(SILVER_PATH):
+            write_deltalake(SILVER_PATH, table, partition_by=["location"], mode="overwrite",
+                            schema_mode="overwrite")
+        else:
+            (
+                DeltaTable(SILVER_PATH)
+                .merge(table, predicate="t.id = s.id", source_alias="s", target_alias="t", merge_schema=True)
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute()
+            )
+        del table
+
+        delta_write_duration_seconds = (time.perf_counter_ns() - delta_write_start) / 1e9
         duration_metric.observe(delta_write_duration_seconds)
 
         metrics.operations_total.labels(operation='silver_delta_write',status='success').inc()
 
-        silver_size = calculate_directory_size(SILVER_PATH)
+        silver_size = calculate_delta_table_size(DeltaTable(SILVER_PATH))
         metrics.data_processed_bytes.labels(operation='silver').set(silver_size)
 
         logger.info("Successfully wrote all %d records to silver layer", total_records)
@@ -161,35 +215,58 @@ def _write_to_silver(df: pd.DataFrame, metrics: Any, duration_metric: Any, total
         raise
 
 
-def _remove_invalid_records(df: pd.DataFrame, key_fields: list,
-                            rows_discarded_metric: Any) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def _remove_invalid_records(df: pd.DataFrame, key_fields: list, rows_discarded_metric: Any,
+                            ingestion_date: Optional[date] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Identify and quarantine records with missing key values.
 
+    Quarantined rows replace the ones written by earlier runs for the same input,
+    so reruns do not quarantine the same rows twice: when the records come from a
+    single ingestion date only that date's rows are replaced, and when the whole
+    bronze table was read (full refresh or no logical date) the quarantine table
+    is overwritten.
+
     Args:
         df: DataFrame to process
         key_fields: List of fields that must not be null
         rows_discarded_metric: Prometheus metric for tracking discarded rows
+        ingestion_date: Ingestion date the records were read from, or None when the
+            whole bronze table was read
         
     Returns:
         Tuple of (valid_df, quarantined_df)
     """
-    null_mask = df[key_fields].isna().any(axis=1)
-    quarantine_df = df[null_mask].copy()
-    valid_df = df[~null_mask].copy()
-
-    if not quarantine_df.empty:
-        quarantine_df['quarantine_reason'] = 'missing_key_values'
-        quarantine_df['quarantine_timestamp'] = datetime.now().isoformat()
-
-        for field in key_fields:
-            field_nulls = df[field].isna().sum()
+    key_nulls = df[key_fields].isna().to_numpy()
+    null_mask = key_nulls.any(axis=1)
+    nulls_per_field = key_nulls.sum(axis=0)
+    valid_df = df.loc[~null_mask]
+    quarantine_df = df.loc[null_mask].assign(
+        quarantine_reason='missing_key_values',
+        quarantine_timestamp=datetime.now().isoformat()
+    )
+    del df
+
+    full_read = ingestion_date is None
+    if not quarantine_df.empty or (full_read and DeltaTable.is_deltatable(QUARANTINE_PATH)):
+        for field, field_nulls in zip(key_fields, nulls_per_field):
             if field_nulls > 0:
                 rows_discarded_metric.labels(reason=f"null_{field}").inc(field_nulls)
 
         try:
-            write_deltalake(QUARANTINE_PATH, quarantine_df, mode="append")
-            logger.info("Quarantined %d rows with missing key values", {len(quarantine_df)})
+            quarantine_table = pa.Table.from_pandas(quarantine_df, preserve_index=False)
+            if full_read:
+                write_deltalake(QUARANTINE_PATH, quarantine_table, mode="overwrite", schema_mode="overwrite",
+                                writer_properties=WriterProperties(compression="ZSTD"))
+            elif _quarantine_has_ingestion_date():
+                write_deltalake(QUARANTINE_PATH, quarantine_table, mode="overwrite",
+                                predicate=f"ingestion_date = '{ingestion_date.isoformat()}'",
+                                schema_mode="merge", writer_properties=WriterProperties(compression="ZSTD"))
+            else:
+                write_deltalake(QUARANTINE_PATH, quarantine_table, mode="append", schema_mode="merge",
+                                writer_properties=WriterProperties(compression="ZSTD"))
+            logger.info("Quarantined %d rows with missing key values", len(quarantine_df))
+
+            _compact_quarantine()
         except ValueError as e:
             logger.error("Schema or parameter error when writing quarantined data: %s", str(e))
         except IOError as e:
@@ -202,3 +279,32 @@ def _remove_invalid_records(df: pd.DataFrame, key_fields: list,
     logger.info("Retained %d rows, discarded %d rows", len(valid_df), len(quarantine_df))
 
     return valid_df
+
+
+def _quarantine_has_ingestion_date() -> bool:
+    """
+    Check whether the quarantine table exists and has an ingestion_date column
+
+    Returns:
+        bool: True if quarantined rows can be replaced per ingestion date
+    """
+    if not DeltaTable.is_deltatable(QUARANTINE_PATH):
+        return False
+    return 'ingestion_date' in [field.name for field in DeltaTable(QUARANTINE_PATH).schema().fields]
+
+
+def _compact_quarantine() -> None:
+    """
+    Compact the quarantine table once appends have accumulated enough small files
+
+    Every silver run appends its rejected rows as a new small file, so the table
+    is bin-packed when it reaches QUARANTINE_COMPACTION_MIN_FILES live files.
+    """
+    quarantine_table = DeltaTable(QUARANTINE_PATH)
+    file_count = len(quarantine_table.file_uris())
+    if file_count < QUARANTINE_COMPACTION_MIN_FILES:
+        return
+
+    result = quarantine_table.optimize.compact(writer_properties=WriterProperties(compression="ZSTD"))
+    logger.info("Compacted quarantine table: %d files removed, %d files added",
+                result.get('numFilesRemoved', 0), result.get('numFilesAdded', 0))
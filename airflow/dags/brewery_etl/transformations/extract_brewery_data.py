@@ -1,11 +1,15 @@
 """Module for extracting brewery data from API and saving to landing zone."""
 
+import math
 import time
 import logging
-from typing import List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Any, Optional, Tuple
 from datetime import datetime
 
-from brewery_etl.transformations.utils.constants import API_PER_PAGE_LIMIT, LANDING_PATH, API_BASE_URL
+from brewery_etl.transformations.utils.constants import (
+    API_PER_PAGE_LIMIT, LANDING_PATH, API_BASE_URL, API_MAX_CONCURRENT_REQUESTS, API_MIN_REQUEST_INTERVAL)
 from brewery_etl.transformations.utils.metrics import brewery_metrics, ETLMetricsContext
 from brewery_etl.transformations.utils.helpers import (
     prepare_landing_directory,
@@ -16,6 +20,24 @@ from brewery_etl.transformations.utils.helpers import (
 logger = logging.getLogger(__name__)
 
 
+class _RequestThrottle:
+    """Spaces out request start times across threads to respect the API host"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request slot is available"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 def extract_brewery_data(**kwargs: Any) -> List[str]:
     """
     Extract data from Open Brewery DB API with pagination and save to landing zone
@@ -65,67 +87,149 @@ def extract_brewery_data(**kwargs: Any) -> List[str]:
         )
 
 
-def _extract_paginated_data(metrics: Any, timestamp: str, pages_total: Any, files_total: Any,
-                            api_requests_total: Any, api_retries: Any) -> List[str]:
+def _fetch_page(page: int, timestamp: str, metrics: Any, throttle: _RequestThrottle,
+                api_requests_total: Any, api_retries: Any) -> Tuple[int, Optional[str], int, int]:
     """
-    Extract paginated data from API
+    Fetch a single page from the API and save it to the landing zone
 
     Args:
-        metrics: Metrics context
+        page: Page number to fetch
         timestamp: Timestamp string for file naming
-        pages_total: Metric for tracking total pages
-        files_total: Metric for tracking total files
-        
+        metrics: Metrics context
+        throttle: Shared throttle spacing out requests
+        api_requests_total: Pre-registered metric for API requests
+        api_retries: Pre-registered metric for API retries
+
     Returns:
-        List of output file paths
+        Tuple of (page, output file or None if the page was empty, records, file size in bytes)
     """
-    page = 1
-    total_breweries = 0
-    more_pages = True
-    output_files = []
-    total_file_size = 0
+    params = {
+        "per_page": API_PER_PAGE_LIMIT,
+        "page": page
+    }
+
+    throttle.wait()
+    response = make_api_request(
+        API_BASE_URL,
+        params,
+        metrics,
+        api_requests_total=api_requests_total,
+        api_retries=api_retries
+    )
+    breweries_page = response.json()
 
+    if not breweries_page:
+        return page, None, 0, 0
+
+    output_file = f"{LANDING_PATH}/breweries_{timestamp}_page{page}.json"
+    file_size_bytes = save_json_data(breweries_page, output_file)
+
+    return page, output_file, len(breweries_page), file_size_bytes
+
+
+def _probe_page_count(metrics: Any, api_requests_total: Any, api_retries: Any) -> Optional[int]:
+    """
+    Ask the API's metadata endpoint how many pages the listing currently has
 
-    while more_pages:
-        params = {
-            "per_page": API_PER_PAGE_LIMIT,
-            "page": page
-        }
+    Args:
+        metrics: Metrics context
+        api_requests_total: Pre-registered metric for API requests
+        api_retries: Pre-registered metric for API retries
 
+    Returns:
+        Expected number of pages, or None if the metadata could not be fetched
+    """
+    try:
         response = make_api_request(
-            API_BASE_URL,
-            params,
+            f"{API_BASE_URL}/meta",
+            {},
             metrics,
             api_requests_total=api_requests_total,
             api_retries=api_retries
         )
-        breweries_page = response.json()
+        total = int(response.json()["total"])
+    except Exception as e:
+        logger.warning("Could not fetch the brewery count, paginating speculatively: %s", str(e))
+        return None
+
+    logger.info("API reports %d breweries", total)
+    return max(1, math.ceil(total / API_PER_PAGE_LIMIT))
+
 
-        if breweries_page:
-            output_file = f"{LANDING_PATH}/breweries_{timestamp}_page{page}.json"
-            file_size_bytes = save_json_data(breweries_page, output_file)
+def _extract_paginated_data(metrics: Any, timestamp: str, pages_total: Any, files_total: Any,
+                            api_requests_total: Any, api_retries: Any) -> List[str]:
+    """
+    Extract paginated data from API
 
-            total_file_size += file_size_bytes
-            output_files.append(output_file)
+    Pages are fetched with up to API_MAX_CONCURRENT_REQUESTS requests in flight.
+    The page count reported by the metadata endpoint bounds the pages scheduled; if
+    it is unavailable, or its last page comes back full because the listing grew,
+    pages are fetched speculatively instead. Once a page comes back short (fewer
+    than API_PER_PAGE_LIMIT records) no further pages are scheduled, and results
+    past that page are ignored.
 
-            records_in_page = len(breweries_page)
-            total_breweries += records_in_page
-            metrics.records_processed_total.labels(operation='extract').inc(records_in_page)
+    Args:
+        metrics: Metrics context
+        timestamp: Timestamp string for file naming
+        pages_total: Metric for tracking total pages
+        files_total: Metric for tracking total files
+        
+    Returns:
+        List of output file paths
+    """
+    throttle = _RequestThrottle(API_MIN_REQUEST_INTERVAL)
+    expected_pages = _probe_page_count(metrics, api_requests_total, api_retries)
+    last_page = None
+    next_page = 1
+    results = {}
+    futures = {}
+
+    executor = ThreadPoolExecutor(max_workers=API_MAX_CONCURRENT_REQUESTS)
+    try:
+        while True:
+            page_limit = last_page if last_page is not None else expected_pages
+            while len(futures) < API_MAX_CONCURRENT_REQUESTS and (page_limit is None or next_page <= page_limit):
+                future = executor.submit(_fetch_page, next_page, timestamp, metrics, throttle,
+                                         api_requests_total, api_retries)
+                futures[future] = next_page
+                next_page += 1
+
+            if not futures:
+                break
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                page = futures.pop(future)
+                page, output_file, records_in_page, file_size_bytes = future.result()
+                results[page] = (output_file, records_in_page, file_size_bytes)
+
+                if records_in_page < API_PER_PAGE_LIMIT and (last_page is None or page < last_page):
+                    last_page = page
+                elif page == expected_pages:
+                    expected_pages = None
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    total_breweries = 0
+    total_file_size = 0
+    output_files = []
+    records_extracted = metrics.records_processed_total.labels(operation='extract')
 
-            logger.info("Extracted page %d with %d breweries to %s", page, records_in_page, output_file)
+    for page in sorted(p for p in results if p <= last_page):
+        output_file, records_in_page, file_size_bytes = results[page]
+        if output_file is None:
+            continue
 
-            if records_in_page < API_PER_PAGE_LIMIT:
-                more_pages = False
-            else:
-                page += 1
-        else:
-            more_pages = False
+        total_file_size += file_size_bytes
+        output_files.append(output_file)
+        total_breweries += records_in_page
+        records_extracted.inc(records_in_page)
 
-        time.sleep(0.5)
+        logger.info("Extracted page %d with %d breweries to %s", page, records_in_page, output_file)
 
     metrics.data_processed_bytes.labels(operation='extract').set(total_file_size)
 
-    pages_total.set(page)
+    pages_total.set(last_page)
     files_total.set(len(output_files))
 
     logger.info("Successfully extracted %d breweries across %d files", total_breweries, len(output_files))
@@ -2,28 +2,33 @@
 
 import json
 import os
+import time
 import logging
-from typing import List, Dict, Any, Tuple
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional
+from datetime import date
 from deltalake import DeltaTable
 from deltalake.writer import write_deltalake
 
-import pandas as pd
+import pyarrow as pa
 
 from brewery_etl.transformations.utils.constants import BRONZE_PATH
 from brewery_etl.transformations.utils.metrics import brewery_metrics, ETLMetricsContext
 from brewery_etl.transformations.utils.helpers import (
-    load_json_file,
+    read_json_table,
     calculate_file_size,
-    calculate_directory_size,
-    add_ingestion_metadata
+    calculate_delta_table_size,
+    count_delta_table_records,
+    add_ingestion_metadata,
+    get_logical_date,
+    is_full_refresh
 )
 
 logger = logging.getLogger(__name__)
 
 def landing_to_bronze(**kwargs: Any) -> str:
     """
-    Process data from landing zone to bronze layer in Delta format using pandas
+    Process data from landing zone to bronze layer in Delta format using pyarrow
 
     Args:
         **kwargs: Additional keyword arguments passed to metrics context
@@ -59,20 +64,20 @@ def landing_to_bronze(**kwargs: Any) -> str:
 
         files_processed.inc(len(landing_files))
 
-        all_data, total_file_size = _process_landing_files(landing_files, metrics)
+        table, total_file_size = _process_landing_files(landing_files, metrics)
 
         metrics.data_processed_bytes.labels(operation='transform').set(total_file_size)
 
-        if not all_data:
+        if table is None or table.num_rows == 0:
             logger.warning("No data to process")
             return BRONZE_PATH
 
-        df = pd.DataFrame(all_data)
-        df = add_ingestion_metadata(df)
+        ingestion_date = get_logical_date(kwargs) or date.today()
+        table = add_ingestion_metadata(table, ingestion_date)
 
-        schema_fields_count.set(len(df.columns))
+        schema_fields_count.set(table.num_columns)
 
-        _write_to_bronze(df, metrics, delta_write_duration)
+        _write_to_bronze(table, metrics, delta_write_duration, ingestion_date, is_full_refresh(kwargs))
 
         return BRONZE_PATH
 
@@ -114,89 +119,133 @@ def _get_landing_files(kwargs: Dict[str, Any], metrics: Any) -> List[str]:
         return []
 
 
-def _process_landing_files(landing_files: List[str], metrics: Any) -> Tuple[List[Dict[str, Any]], int]:
+def _read_landing_file(file_path: str, metrics: Any) -> Tuple[pa.Table, int]:
     """
-    Process landing files and collect data
-    
+    Read a single landing file into an Arrow table
+
     Args:
-        landing_files: List of landing file paths
+        file_path: Landing file path
         metrics: Metrics context
-        
+
     Returns:
-        Tuple containing list of data records and total file size
+        Tuple containing the file's Arrow table and its size in bytes
     """
-    all_data = []
-    total_file_size = 0
+    try:
+        table = read_json_table(file_path)
+        file_size = calculate_file_size(file_path)
 
-    for file_path in landing_files:
-        try:
-            data = load_json_file(file_path)
+        logger.info("Processed file %s with %d records", file_path, table.num_rows)
+        return table, file_size
 
-            file_size = calculate_file_size(file_path)
-            total_file_size += file_size
+    except FileNotFoundError as e:
+        metrics.operations_total.labels(operation='transform_file_read', status='failure').inc()
+        logger.error("File not found %s: %s", file_path, str(e))
+        raise
+    except json.JSONDecodeError as e:
+        metrics.operations_total.labels(operation='transform_file_read', status='failure').inc()
+        logger.error("Invalid JSON in file %s: %s", file_path, str(e))
+        raise
+    except Exception as e:
+        metrics.operations_total.labels(operation='transform_file_read', status='failure').inc()
+        logger.error("Error processing file %s: %s", file_path, str(e))
+        raise
 
-            records_in_file = len(data)
-            all_data.extend(data)
 
-            metrics.records_processed_total.labels(operation='transform').inc(records_in_file)
+def _process_landing_files(landing_files: List[str], metrics: Any) -> Tuple[Optional[pa.Table], int]:
+    """
+    Process landing files and collect data into a single Arrow table
 
-            metrics.operations_total.labels(operation='transform_file_read', status='success').inc()
+    Files are read and converted to Arrow concurrently on a thread pool, each into
+    its own table; results keep the order of landing_files. Schemas are unified
+    across files, promoting types where they differ.
 
-            logger.info("Processed file %s with %d records", file_path, records_in_file)
+    Args:
+        landing_files: List of landing file paths
+        metrics: Metrics context
 
-        except FileNotFoundError as e:
-            logger.error("File not found %s: %s", file_path, str(e))
-            raise
-        except json.JSONDecodeError as e:
-            logger.error("Invalid JSON in file %s: %s", file_path, str(e))
-            raise
-        except Exception as e:
-            logger.error("Error processing file %s: %s", file_path, str(e))
-            raise
-        finally:
-            metrics.operations_total.labels(operation='transform_file_read', status='failure').inc()
+    Returns:
+        Tuple containing the combined table (None if no records) and total file size
+    """
+    max_workers = max(1, min(32, (os.cpu_count() or 1) * 2, len(landing_files)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda file_path: _read_landing_file(file_path, metrics), landing_files))
+
+    tables = [table for table, _ in results if table.num_rows]
+    total_records = sum(table.num_rows for table in tables)
+    total_file_size = sum(file_size for _, file_size in results)
+
+    metrics.records_processed_total.labels(operation='transform').inc(total_records)
+    metrics.operations_total.labels(operation='transform_file_read', status='success').inc(len(results))
 
-    return all_data, total_file_size
+    if not tables:
+        return None, total_file_size
 
+    return pa.concat_tables(tables, promote_options="permissive"), total_file_size
 
-def _write_to_bronze(df: pd.DataFrame, metrics: Any, duration_metric: Any) -> None:
+
+def _write_to_bronze(table: pa.Table, metrics: Any, duration_metric: Any, ingestion_date: date,
+                     full_refresh: bool = False) -> None:
     """
-    Write dataframe to bronze layer
+    Write Arrow table to bronze layer, partitioned by ingestion date
+
+    Only the run's ingestion_date partition is replaced, so reruns and retries of
+    the same run do not add another snapshot. The whole table is overwritten when
+    a full refresh is requested, it does not exist yet, or it is not partitioned
+    by ingestion date (tables written before partitioning was introduced).
     
     Args:
-        df: DataFrame to write
+        table: Arrow table to write
         metrics: Metrics context
         duration_metric: Metric for tracking write duration
+        ingestion_date: Partition the table's records belong to
+        full_refresh: Whether to overwrite the whole bronze table
         
     Raises:
         Exception: If writing fails
     """
-    delta_write_start = datetime.now()
+    delta_write_start = time.perf_counter_ns()
 
     try:
-        write_deltalake(BRONZE_PATH, df, mode="overwrite")
-
-        delta_write_duration_seconds = (datetime.now() - delta_write_start).total_seconds()
+        overwrite = (
+            full_refresh
+            or not DeltaTable.is_deltatable(BRONZE_PATH)
+            or DeltaTable(BRONZE_PATH).metadata().partition_columns != ["ingestion_date"]
+        )
+        if overwrite:
+            write_deltalake(BRONZE_PATH, table, partition_by=["ingestion_date"], mode="overwrite",
+                            schema_mode="overwrite")
+        else:
+            write_deltalake(BRONZE_PATH, table, partition_by=["ingestion_date"], mode="overwrite",
+                            predicate=f"ingestion_date = '{ingestion_date.isoformat()}'",
+                            schema_mode="merge")
+
+        delta_write_duration_seconds = (time.perf_counter_ns() - delta_write_start) / 1e9
         duration_metric.observe(delta_write_duration_seconds)
 
         metrics.operations_total.labels(operation='transform_delta_write', status='success').inc()
 
-        bronze_df = DeltaTable(BRONZE_PATH).to_pandas()
-        bronze_records = len(bronze_df)
+        bronze_records = table.num_rows
+        bronze_table = DeltaTable(BRONZE_PATH)
+
+        committed_records = count_delta_table_records(bronze_table, {'ingestion_date': ingestion_date})
+        if committed_records is not None and committed_records != bronze_records:
+            logger.warning("Bronze Delta log reports %d records for %s, expected %d",
+                           committed_records, ingestion_date, bronze_records)
 
-        bronze_size = calculate_directory_size(BRONZE_PATH)
+        bronze_size = calculate_delta_table_size(bronze_table)
         metrics.data_processed_bytes.labels(operation='load').set(bronze_size)
 
         logger.info("Successfully loaded %d records to bronze layer", bronze_records)
 
     except ValueError as e:
+        metrics.operations_total.labels(operation='transform_delta_write', status='failure').inc()
         logger.error("Schema or parameter error writing to Delta format: %s", str(e))
         raise
     except IOError as e:
+        metrics.operations_total.labels(operation='transform_delta_write', status='failure').inc()
         logger.error("I/O error writing to Delta format: %s", str(e))
         raise
     except Exception as e:
+        metrics.operations_total.labels(operation='transform_delta_write', status='failure').inc()
         logger.error("Unexpected error writing to Delta format: %s", str(e))
         raise
-    finally:
-        metrics.operations_total.labels(operation='transform_delta_write', status='failure').inc()
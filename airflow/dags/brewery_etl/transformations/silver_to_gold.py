@@ -1,13 +1,15 @@
 """Module for transforming data from silver to gold layer with aggregations."""
 
 import os
+import time
 import logging
 from typing import Dict, Any, Optional
-from datetime import datetime
 
 import pandas as pd
+from deltalake import DeltaTable
 
-from brewery_etl.transformations.utils.constants import GOLD_PATH, SILVER_PATH
+from brewery_etl.transformations.utils.constants import (
+    GOLD_PATH, SILVER_PATH, GOLD_SOURCE_COLUMNS, GOLD_PARTITION_COLUMNS)
 from brewery_etl.transformations.utils.metrics import brewery_metrics, ETLMetricsContext
 from brewery_etl.transformations.utils.helpers import (
     read_delta_table,
@@ -63,7 +65,7 @@ def silver_to_gold(**kwargs: Any) -> str:
             'gauge',
             'brewery_etl_gold_schema_fields_count',
             'Number of fields in the schema'
-        ).set(len(df.columns))
+        ).set(_count_silver_schema_fields(df))
 
         aggregations = _create_aggregations(df, metrics)
         aggregation_count.set(len(aggregations))
@@ -88,7 +90,10 @@ def _load_silver_data(metrics: Any) -> Optional[pd.DataFrame]:
     """
     try:
         logger.info("Attempting to read silver layer as a single Delta table")
-        df = read_delta_table(SILVER_PATH, metrics, 'silver_read', 'silver')
+        table = read_delta_table(SILVER_PATH, metrics, 'silver_read', 'silver', as_arrow=True,
+                                 columns=GOLD_SOURCE_COLUMNS)
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+        del table
 
         metrics.records_processed_total.labels(operation='load').inc(len(df))
         return df
@@ -99,6 +104,24 @@ def _load_silver_data(metrics: Any) -> Optional[pd.DataFrame]:
         return read_partitioned_data(SILVER_PATH, "location=*", metrics, 'silver')
 
 
+def _count_silver_schema_fields(df: pd.DataFrame) -> int:
+    """
+    Count the fields of the silver schema
+
+    Only the aggregated columns are loaded from the silver table, so the count is
+    taken from the table schema rather than from the loaded DataFrame.
+
+    Args:
+        df: Loaded silver data, used when silver is not a single Delta table
+
+    Returns:
+        Number of fields in the silver schema
+    """
+    if DeltaTable.is_deltatable(SILVER_PATH):
+        return len(DeltaTable(SILVER_PATH).schema().fields)
+    return len(df.columns)
+
+
 def _create_aggregations(df: pd.DataFrame, metrics: Any) -> Dict[str, pd.DataFrame]:
     """
     Create aggregations from DataFrame
@@ -111,18 +134,26 @@ def _create_aggregations(df: pd.DataFrame, metrics: Any) -> Dict[str, pd.DataFra
         Dictionary mapping aggregation names to DataFrames
     """
     logger.info("Creating aggregations")
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
+
+    by_type_location = create_aggregation(
+        df, ["brewery_type", "location", "state", "city"], "brewery_count"
+    )
+    # brewery_type is never null in silver, so by_location is the marginal of
+    # by_type_location and is summed from it instead of re-scanning df
+    by_location = (
+        by_type_location
+        .groupby(["location", "state", "city"], observed=True)["brewery_count"]
+        .sum()
+        .reset_index()
+    )
 
     aggregations = {
-        "by_type_location": create_aggregation(
-            df, ["brewery_type", "location", "state", "city"], "brewery_count"
-        ),
-        "by_location": create_aggregation(
-            df, ["location", "state", "city"], "brewery_count"
-        )
+        "by_type_location": by_type_location,
+        "by_location": by_location
     }
 
-    aggregation_duration = (datetime.now() - start_time).total_seconds()
+    aggregation_duration = (time.perf_counter_ns() - start_time) / 1e9
     metrics.processing_duration_seconds.labels(operation='aggregation').observe(aggregation_duration)
 
     for name, agg_df in aggregations.items():
@@ -142,7 +173,8 @@ def _write_aggregation(name: str, df: pd.DataFrame, metrics: Any) -> None:
     """
     output_path = f"{GOLD_PATH}/{name}"
     try:
-        write_delta_table(output_path, df, metrics, name, 'gold')
+        write_delta_table(output_path, df, metrics, name, 'gold',
+                          partition_by=GOLD_PARTITION_COLUMNS.get(name))
     except IOError as e:
         logger.error("I/O error writing aggregation %s: %s", name, str(e))
     except ValueError as e:
@@ -12,10 +12,29 @@ QUARANTINE_PATH = f'{DLH_PATH}/99-quarantine'
 API_BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
 API_PER_PAGE_LIMIT = 200
 API_TIMEOUT = 120
+API_CONNECT_TIMEOUT = 5
+API_CONNECTION_POOL_SIZE = 16
+API_MAX_CONCURRENT_REQUESTS = 8
+API_MIN_REQUEST_INTERVAL = 0.1
+API_MAX_RETRIES = 3
+API_RETRY_BACKOFF_FACTOR = 0.5
+API_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
 
 # ETL constants
+QUARANTINE_COMPACTION_MIN_FILES = 32
 KEY_FIELDS = ['id', 'brewery_type', 'state', 'city', 'country']
 STRING_COLUMNS = ['id', 'brewery_type', 'state', 'city', 'country']
+# Group-by engine for gold aggregations: 'numpy' (factorize + bincount), 'cython'
+# (pandas groupby) or 'numba' (requires the optional numba dependency, falls back
+# to 'numpy' when missing)
+AGGREGATION_ENGINE = 'numpy'
+# Silver columns read by the gold aggregations
+GOLD_SOURCE_COLUMNS = ['brewery_type', 'location', 'state', 'city']
+# Partition columns of each gold aggregation table
+GOLD_PARTITION_COLUMNS = {
+    'by_type_location': ['state'],
+    'by_location': ['location']
+}
 STANDARD_BREWERY_TYPES = {
     'micro': 'micro',
     'nano': 'nano',
@@ -1,24 +1,66 @@
 """Helper functions for brewery ETL processes."""
 
 import glob
-import json
 import logging
 import os
-import re
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pj
 import requests
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
+from datetime import date, datetime
 from deltalake import DeltaTable
 from deltalake.writer import write_deltalake
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from brewery_etl.transformations.utils.constants import API_TIMEOUT, STANDARD_BREWERY_TYPES
+from brewery_etl.transformations.utils.constants import (
+    API_TIMEOUT, API_CONNECT_TIMEOUT, API_CONNECTION_POOL_SIZE, API_MAX_RETRIES,
+    API_RETRY_BACKOFF_FACTOR, API_RETRY_STATUS_CODES, STANDARD_BREWERY_TYPES, AGGREGATION_ENGINE)
 
 logger = logging.getLogger(__name__)
 
+# Matched with Arrow's compiled RE2 engine over the whole column
+_URL_SCHEME_PATTERN = '^https?://'
+
+
+def _create_api_session() -> requests.Session:
+    """
+    Create the HTTP session shared by API requests
+
+    The session keeps connections alive across pages so each request does not pay
+    a new TCP/TLS handshake, and asks for gzip-compressed responses. Connection
+    errors and retryable status codes are retried by the adapter with exponential
+    backoff, honouring Retry-After.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = "gzip"
+    retry = Retry(
+        total=API_MAX_RETRIES,
+        backoff_factor=API_RETRY_BACKOFF_FACTOR,
+        status_forcelist=API_RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=API_CONNECTION_POOL_SIZE, pool_maxsize=API_CONNECTION_POOL_SIZE,
+                          max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_api_session = _create_api_session()
+
 
 def validate_schema(df: pd.DataFrame, expected_columns: List[str]) -> bool:
     """
@@ -40,6 +82,26 @@ def validate_schema(df: pd.DataFrame, expected_columns: List[str]) -> bool:
     return True
 
 
+def _apply_to_unique_values(series: pd.Series,
+                            transform: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Apply a vectorized transformation to the distinct values of a series only
+
+    Location columns hold a few hundred distinct values across many rows, so the
+    string work runs over the factorized uniques and is broadcast back by code.
+
+    Args:
+        series: Series to transform
+        transform: Function applied to a Series of the distinct values
+
+    Returns:
+        Transformed series aligned with the input index
+    """
+    codes, uniques = pd.factorize(series)
+    transformed = transform(pd.Series(uniques))
+    return pd.Series(transformed.array.take(codes, allow_fill=True), index=series.index, name=series.name)
+
+
 def standardize_location_fields(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize location fields for consistency
@@ -50,11 +112,11 @@ def standardize_location_fields(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with standardized location fields
     """
-    df['state'] = df['state'].str.upper()
-    df['city'] = df['city'].str.upper()
-    df['country'] = df['country'].str.upper()
-    df['location'] = df['country']
-    return df
+    return df.assign(
+        **{column: _apply_to_unique_values(df[column], lambda values: values.str.upper())
+           for column in ('state', 'city', 'country')},
+        location=lambda frame: frame['country']
+    )
 
 
 def standardize_brewery_types(df: pd.DataFrame) -> pd.DataFrame:
@@ -70,18 +132,14 @@ def standardize_brewery_types(df: pd.DataFrame) -> pd.DataFrame:
     if 'brewery_type' not in df.columns:
         return df
 
-    result_df = df.copy()
-
-    def standardize_type(brewery_type):
-        if pd.isna(brewery_type) or brewery_type is None:
-            return 'unknown'
-        brewery_type = brewery_type.lower().strip()
-        return STANDARD_BREWERY_TYPES.get(brewery_type, 'other')
-
-    result_df['brewery_type'] = result_df['brewery_type'].apply(standardize_type)
+    result_df = df.assign(brewery_type=_apply_to_unique_values(
+        df['brewery_type'],
+        lambda values: values.str.lower().str.strip().map(STANDARD_BREWERY_TYPES).fillna('other')
+    ).fillna('unknown'))
 
-    type_counts = result_df['brewery_type'].value_counts()
-    logger.info("Brewery type distribution after standardization: %s", type_counts.to_dict())
+    if logger.isEnabledFor(logging.INFO):
+        type_counts = result_df['brewery_type'].value_counts()
+        logger.info("Brewery type distribution after standardization: %s", type_counts.to_dict())
 
     return result_df
 
@@ -99,18 +157,32 @@ def standardize_website_urls(df: pd.DataFrame) -> pd.DataFrame:
     if 'website_url' not in df.columns:
         return df
 
-    result_df = df.copy()
-    def standardize_url(url):
-        if pd.isna(url) or url is None or url.strip() == '':
-            return None
-        url = url.strip()
-        if not re.match(r'^https?://', url):
-            url = 'http://' + url
-        return url
+    urls = pc.utf8_trim_whitespace(pa.array(df['website_url'], type=pa.string(), from_pandas=True))
+    urls = pc.if_else(pc.equal(urls, ''), None, urls)
+    has_scheme = pc.match_substring_regex(urls, _URL_SCHEME_PATTERN)
+    urls = pc.if_else(has_scheme, urls, pc.binary_join_element_wise('http://', urls, ''))
 
-    result_df['website_url'] = result_df['website_url'].apply(standardize_url)
+    return df.assign(website_url=pd.array(urls, dtype=pd.ArrowDtype(pa.string())))
 
-    return result_df
+
+def count_unique_values(series: pd.Series, dropna: bool = True) -> int:
+    """
+    Count distinct values of a series
+
+    Arrow-backed series are counted with Arrow's hash kernel without converting
+    values to Python objects; other dtypes use pandas nunique.
+
+    Args:
+        series: Series to count
+        dropna: Ignore nulls; otherwise nulls count as one distinct value
+
+    Returns:
+        int: Number of distinct values
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype) or (isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'):
+        return pc.count_distinct(pa.array(series), mode='only_valid' if dropna else 'all').as_py()
+    return int(series.nunique(dropna=dropna))
 
 
 def check_duplicate_ids(df: pd.DataFrame, metrics: Any) -> int:
@@ -124,10 +196,14 @@ def check_duplicate_ids(df: pd.DataFrame, metrics: Any) -> int:
     Returns:
         int: Number of duplicate IDs found
     """
-    duplicate_ids = df['id'].duplicated().sum()
+    duplicate_ids = len(df) - count_unique_values(df['id'], dropna=False)
     if duplicate_ids > 0:
         logger.warning("Found %d duplicate IDs", duplicate_ids)
-        metrics.register_metric('gauge', 'brewery_etl_silver_duplicate_ids').set(duplicate_ids)
+        metrics.register_metric(
+            'gauge',
+            'brewery_etl_silver_duplicate_ids',
+            'Number of duplicate IDs found in silver layer input'
+        ).set(duplicate_ids)
     return duplicate_ids
 
 
@@ -135,6 +211,10 @@ def add_processing_metadata(df: pd.DataFrame, version: str = '1.0') -> pd.DataFr
     """
     Add processing metadata to dataframe
 
+    The processing timestamp is computed once per call. Both columns are
+    single-category categoricals, so each row stores a one-byte code instead of a
+    string, and they are written to Delta as dictionary-encoded strings.
+
     Args:
         df: DataFrame to enhance
         version: ETL version string
@@ -142,28 +222,51 @@ def add_processing_metadata(df: pd.DataFrame, version: str = '1.0') -> pd.DataFr
     Returns:
         DataFrame with added metadata
     """
-    df['processed_at'] = datetime.now().isoformat()
-    df['etl_version'] = version
-    return df
+    codes = np.zeros(len(df), dtype=np.int8)
+    return df.assign(
+        processed_at=pd.Categorical.from_codes(codes, categories=[datetime.now().isoformat()]),
+        etl_version=pd.Categorical.from_codes(codes, categories=[version])
+    )
 
 
-def calculate_directory_size(directory_path: str) -> int:
+def calculate_delta_table_size(delta_table: DeltaTable) -> int:
     """
-    Calculate total size of files in a directory
+    Calculate total size of the live data files of a Delta table
+
+    Sizes come from the add actions in the transaction log, so no file is stat-ed
+    and files from older table versions are not counted.
 
     Args:
-        directory_path: Path to directory
+        delta_table: Loaded Delta table
 
     Returns:
         int: Total size in bytes
     """
-    total_size = 0
-    for dirpath, _, filenames in os.walk(directory_path):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            if os.path.isfile(file_path):
-                total_size += os.path.getsize(file_path)
-    return total_size
+    size_bytes = pa.table(delta_table.get_add_actions(flatten=True)).column('size_bytes')
+    return pc.sum(size_bytes).as_py() or 0
+
+
+def count_delta_table_records(delta_table: DeltaTable,
+                              partition_values: Optional[Dict[str, Any]] = None) -> Optional[int]:
+    """
+    Count records in a Delta table from its transaction log statistics
+
+    Only the log is read, not the Parquet data files.
+
+    Args:
+        delta_table: Loaded Delta table
+        partition_values: Only count files in the partition with these values
+
+    Returns:
+        int: Number of records, or None if any file is missing row count statistics
+    """
+    add_actions = pa.table(delta_table.get_add_actions(flatten=True))
+    for column, value in (partition_values or {}).items():
+        add_actions = add_actions.filter(pc.equal(add_actions[f'partition.{column}'], value))
+    num_records = add_actions.column('num_records')
+    if num_records.null_count:
+        return None
+    return pc.sum(num_records).as_py() or 0
 
 
 def fill_null_values(df: pd.DataFrame, fill_values: Dict[str, Any]) -> pd.DataFrame:
@@ -182,7 +285,9 @@ def fill_null_values(df: pd.DataFrame, fill_values: Dict[str, Any]) -> pd.DataFr
 
 def convert_string_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """
-    Convert specified columns to string type
+    Convert specified columns to Arrow-backed string type in a single cast
+
+    Columns already stored as Arrow strings are left as they are.
 
     Args:
         df: DataFrame to process
@@ -191,10 +296,41 @@ def convert_string_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame
     Returns:
         DataFrame with converted columns
     """
-    for col in columns:
-        if col in df.columns:
-            df[col] = df[col].astype(str)
-    return df
+    string_dtype = pd.ArrowDtype(pa.string())
+    return df.astype({col: string_dtype for col in columns if col in df.columns})
+
+
+def is_full_refresh(kwargs: Dict[str, Any]) -> bool:
+    """
+    Check whether the run asks for a full refresh of the Delta layers
+
+    The flag is read from the task keyword arguments or from the DAG run params.
+
+    Args:
+        kwargs: Keyword arguments containing the task context
+
+    Returns:
+        bool: True if layers should be rebuilt with overwrite instead of incremental writes
+    """
+    params = kwargs.get('params') or {}
+    return bool(kwargs.get('full_refresh') or params.get('full_refresh'))
+
+
+def get_logical_date(kwargs: Dict[str, Any]) -> Optional[date]:
+    """
+    Get the logical date of the current run from the Airflow context
+
+    Bronze partitions and the silver read are both keyed on this date, so every
+    task of a run (and its retries) works on the same ingestion_date partition.
+
+    Args:
+        kwargs: Keyword arguments containing the task context
+
+    Returns:
+        Logical date of the run, or None when not running with a logical date
+    """
+    logical_date = kwargs.get('logical_date') or kwargs.get('execution_date')
+    return logical_date.date() if logical_date else None
 
 
 def prepare_landing_directory(landing_path: str) -> None:
@@ -212,9 +348,12 @@ def prepare_landing_directory(landing_path: str) -> None:
 
 
 def make_api_request(url: str, params: Dict[str, Any], metrics: Any, api_requests_total: Any,
-                     api_retries: Any, max_retries: int = 3) -> Union[requests.Response, None]:
+                     api_retries: Any) -> requests.Response:
     """
-    Make API request with retry logic and metrics tracking
+    Make API request with metrics tracking
+
+    Retries are handled by the shared session's adapter (see _create_api_session);
+    the retries it made are counted from the response's retry history.
 
     Args:
         url: API URL
@@ -222,45 +361,40 @@ def make_api_request(url: str, params: Dict[str, Any], metrics: Any, api_request
         metrics: Metrics context for tracking
         api_requests_total: Pre-registered metric for API requests
         api_retries: Pre-registered metric for API retries
-        max_retries: Maximum number of retry attempts
         
     Returns:
         Response object from successful request
         
     Raises:
-        Exception: If all retry attempts fail
+        Exception: If the request still fails after all retry attempts
     """
     api_requests_total.inc()
 
-    retry_count = 0
-    while retry_count < max_retries:
-        try:
-            start_time = time.time()
-            response = requests.get(url, params=params, timeout=API_TIMEOUT)
-            response_time = time.time() - start_time
-
-            metrics.processing_duration_seconds.labels(operation='api_request').observe(response_time)
+    try:
+        start_time = time.perf_counter_ns()
+        response = _api_session.get(url, params=params, timeout=(API_CONNECT_TIMEOUT, API_TIMEOUT))
+        response_time = (time.perf_counter_ns() - start_time) / 1e9
 
-            response.raise_for_status()
+        metrics.processing_duration_seconds.labels(operation='api_request').observe(response_time)
 
-            metrics.operations_total.labels(operation='api_request',status='success').inc()
+        retries = getattr(response.raw, 'retries', None)
+        if retries is not None and retries.history:
+            api_retries.inc(len(retries.history))
 
-            return response
-        except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as e:
-            retry_count += 1
-            api_retries.inc()
+        response.raise_for_status()
 
-            logger.warning("API request failed (attempt %d/%d): %s", retry_count, max_retries, str(e))
+        metrics.operations_total.labels(operation='api_request',status='success').inc()
 
-            if retry_count >= max_retries:
-                metrics.operations_total.labels(operation='api_request',status='failure').inc()
-                raise Exception(f'Failed to fetch data after {max_retries} retries: {str(e)}') from e
-            time.sleep(5)
+        return response
+    except requests.exceptions.RequestException as e:
+        metrics.operations_total.labels(operation='api_request',status='failure').inc()
+        logger.warning("API request failed after up to %d retries: %s", API_MAX_RETRIES, str(e))
+        raise Exception(f'Failed to fetch data after {API_MAX_RETRIES} retries: {str(e)}') from e
 
 
 def save_json_data(data: List[Dict[str, Any]], output_file: str) -> int:
     """
-    Save JSON data to file
+    Save JSON records to file as newline-delimited JSON (one record per line)
 
     Args:
         data: Data to save
@@ -269,15 +403,15 @@ def save_json_data(data: List[Dict[str, Any]], output_file: str) -> int:
     Returns:
         Size of saved file in bytes
     """
-    with open(output_file, 'w', encoding='utf-8') as file_handle:
-        json.dump(data, file_handle)
+    with open(output_file, 'wb') as file_handle:
+        file_handle.write(b''.join(orjson.dumps(record) + b'\n' for record in data))
 
     return os.path.getsize(output_file)
 
 
 def load_json_file(file_path: str) -> List[Dict[str, Any]]:
     """
-    Load JSON data from file
+    Load JSON data from file, either newline-delimited records or a single array
 
     Args:
         file_path: Path to JSON file
@@ -289,13 +423,41 @@ def load_json_file(file_path: str) -> List[Dict[str, Any]]:
         Exception: If file cannot be read or parsed
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file_handle:
-            return json.load(file_handle)
+        with open(file_path, 'rb') as file_handle:
+            content = file_handle.read()
+        if content.lstrip().startswith(b'['):
+            return orjson.loads(content)
+        return [orjson.loads(line) for line in content.splitlines() if line.strip()]
     except Exception as e:
         logger.error("Failed to load JSON file %s: %s", file_path, str(e))
         raise
 
 
+def read_json_table(file_path: str) -> pa.Table:
+    """
+    Read a newline-delimited JSON file straight into an Arrow table
+
+    Files holding a single JSON array (the landing format before NDJSON) are
+    parsed with load_json_file instead. Columns are the union of the records'
+    keys, with nulls where a record lacks a field.
+
+    Args:
+        file_path: Path to JSON file
+
+    Returns:
+        Arrow table with one row per record
+
+    Raises:
+        Exception: If file cannot be read or parsed
+    """
+    try:
+        return pj.read_json(file_path)
+    except pa.ArrowInvalid:
+        records = load_json_file(file_path)
+        columns = dict.fromkeys(key for record in records for key in record)
+        return pa.Table.from_pydict({column: [record.get(column) for record in records] for column in columns})
+
+
 def calculate_file_size(file_path: str) -> int:
     """
     Calculate size of a file in bytes
@@ -309,22 +471,27 @@ def calculate_file_size(file_path: str) -> int:
     return os.path.getsize(file_path)
 
 
-def add_ingestion_metadata(df: pd.DataFrame) -> pd.DataFrame:
+def add_ingestion_metadata(table: pa.Table, ingestion_date: Optional[date] = None) -> pa.Table:
     """
-    Add ingestion metadata to dataframe
+    Add ingestion metadata to an Arrow table
 
     Args:
-        df: DataFrame to enhance
+        table: Arrow table to enhance
+        ingestion_date: Date of the bronze partition, defaults to today
         
     Returns:
-        DataFrame with added metadata
+        Arrow table with added metadata
     """
-    df["ingestion_timestamp"] = datetime.now()
-    return df
+    ingested_at = datetime.now()
+    table = table.append_column(
+        "ingestion_timestamp", pa.repeat(pa.scalar(ingested_at, pa.timestamp('us')), table.num_rows))
+    return table.append_column(
+        "ingestion_date", pa.repeat(pa.scalar(ingestion_date or ingested_at.date(), pa.date32()), table.num_rows))
 
 
 def read_delta_table(path: str, metrics: Any, operation_name: str = 'delta_read',
-                     layer_name: str = 'data') -> pd.DataFrame:
+                     layer_name: str = 'data', as_arrow: bool = False,
+                     columns: Optional[List[str]] = None) -> Union[pd.DataFrame, pa.Table]:
     """
     Read a Delta table with metrics tracking
 
@@ -333,24 +500,30 @@ def read_delta_table(path: str, metrics: Any, operation_name: str = 'delta_read'
         metrics: Metrics context
         operation_name: Name of the operation for metrics
         layer_name: Name of the data layer (bronze, silver, gold)
+        as_arrow: Return the Arrow table without converting it to pandas
+        columns: Columns to read, or None to read all of them
         
     Returns:
-        DataFrame from Delta table
+        DataFrame (or Arrow table if as_arrow) from Delta table
         
     Raises:
         Exception: If reading fails
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     try:
-        df = DeltaTable(path).to_pandas()
-        read_duration = (datetime.now() - start_time).total_seconds()
+        delta_table = DeltaTable(path)
+        if as_arrow:
+            data = delta_table.to_pyarrow_table(columns=columns)
+        else:
+            data = delta_table.to_pandas(columns=columns)
+        read_duration = (time.perf_counter_ns() - start_time) / 1e9
 
         metrics.processing_duration_seconds.labels(operation=operation_name).observe(read_duration)
 
         metrics.operations_total.labels(operation=operation_name, status='success').inc()
 
-        logger.info("Successfully read %d records from %s layer at %s", len(df), layer_name, path)
-        return df
+        logger.info("Successfully read %d records from %s layer at %s", len(data), layer_name, path)
+        return data
     except Exception as e:
         metrics.operations_total.labels(
             operation=operation_name, 
@@ -378,30 +551,26 @@ def write_delta_table(path: str, df: pd.DataFrame, metrics: Any, operation_name:
     Raises:
         Exception: If writing fails
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     try:
+        # An overwrite may change the partition columns of an existing table
+        schema_mode = "overwrite" if mode == "overwrite" else None
         if partition_by:
-            write_deltalake(path, df, mode=mode, partition_by=partition_by)
+            write_deltalake(path, df, mode=mode, partition_by=partition_by, schema_mode=schema_mode)
         else:
-            write_deltalake(path, df, mode=mode)
+            write_deltalake(path, df, mode=mode, schema_mode=schema_mode)
 
-        write_duration = (datetime.now() - start_time).total_seconds()
-
-        duration_metric = metrics.register_metric(
-            'histogram',
-            f'brewery_etl_{layer_name}_delta_write_duration_seconds',
-            f'Time taken to write to Delta format in {layer_name} layer',
-            ['operation']
-        )
+        write_duration = (time.perf_counter_ns() - start_time) / 1e9
 
-        duration_metric.labels(operation=operation_name).observe(write_duration)
+        metrics.delta_write_duration_seconds.labels(
+            operation=operation_name, layer=layer_name).observe(write_duration)
 
         metrics.operations_total.labels(operation=f'{layer_name}_{operation_name}', status='success').inc()
 
         logger.info("Successfully wrote %d records to %s layer at %s", len(df), layer_name, path)
 
         try:
-            data_size = calculate_directory_size(path)
+            data_size = calculate_delta_table_size(DeltaTable(path))
             metrics.data_processed_bytes.labels(operation=layer_name).set(data_size)
         except FileNotFoundError as e:
             logger.warning("Directory not found when calculating size for %s: %s", path, str(e))
@@ -433,6 +602,30 @@ def _find_partitions(base_path: str, pattern: str) -> List[str]:
     return partition_paths
 
 
+def _read_partition(path: str, metrics: Any, operation_prefix: str) -> Optional[pa.Table]:
+    """
+    Read a single partition, logging and swallowing read errors
+
+    Args:
+        path: Partition path
+        metrics: Metrics context
+        operation_prefix: Prefix for operation names in metrics
+
+    Returns:
+        Arrow table from the partition or None if it could not be read
+    """
+    try:
+        logger.info("Reading partition: %s", path)
+        return read_delta_table(path, metrics, f'{operation_prefix}_read', operation_prefix, as_arrow=True)
+    except FileNotFoundError as e:
+        logger.error("Partition path not found %s: %s", path, str(e))
+    except IOError as e:
+        logger.error("I/O error reading partition %s: %s", path, str(e))
+    except Exception as e:
+        logger.error("Unexpected error reading partition %s: %s", path, str(e))
+    return None
+
+
 def read_partitioned_data(base_path: str, partition_pattern: str, metrics: Any,
                           operation_prefix: str = 'partition') -> Optional[pd.DataFrame]:
     """
@@ -455,29 +648,25 @@ def read_partitioned_data(base_path: str, partition_pattern: str, metrics: Any,
         'Number of partitions processed'
     ).set(len(partition_paths))
 
-    dfs = []
-    successful_partitions = 0
-    total_records = 0
-
-    for path in partition_paths:
-        try:
-            logger.info("Reading partition: %s", path)
-            partition_df = read_delta_table(path, metrics, f'{operation_prefix}_read', operation_prefix)
+    if not partition_paths:
+        logger.warning("No data found in partitions at %s", base_path)
+        return None
 
-            records_in_partition = len(partition_df)
-            total_records += records_in_partition
-            dfs.append(partition_df)
-            successful_partitions += 1
+    max_workers = min(16, len(partition_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda path: _read_partition(path, metrics, operation_prefix), partition_paths
+        )
+        tables = [table for table in results if table is not None]
 
-        except FileNotFoundError as e:
-            logger.error("Partition path not found %s: %s", path, str(e))
-        except IOError as e:
-            logger.error("I/O error reading partition %s: %s", path, str(e))
-        except Exception as e:
-            logger.error("Unexpected error reading partition %s: %s", path, str(e))
+    successful_partitions = len(tables)
+    total_records = sum(table.num_rows for table in tables)
 
-    if dfs:
-        df = pd.concat(dfs, ignore_index=True)
+    if tables:
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        del tables
+        df = combined.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+        del combined
         logger.info("Combined %d records from %d partitions", len(df), len(partition_paths))
 
         metrics.records_processed_total.labels(operation=operation_prefix).inc(total_records)
@@ -493,17 +682,125 @@ def read_partitioned_data(base_path: str, partition_pattern: str, metrics: Any,
     return None
 
 
+def _factorize_groups(df: pd.DataFrame,
+                      group_by_columns: List[str]) -> Optional[Tuple[np.ndarray, np.ndarray, List[pd.Index]]]:
+    """
+    Encode the group-by columns as a single composite integer key per row
+
+    Each column is factorized with sorted uniques and the codes are combined in
+    mixed radix, so sorting the composite key sorts groups like groupby does.
+    Rows with a null in any group-by column are dropped, as groupby does by default.
+
+    Args:
+        df: DataFrame to encode
+        group_by_columns: Columns to group by
+
+    Returns:
+        Tuple of (composite key per valid row, cardinality per column, uniques per
+        column), or None if the key space does not fit in int64
+    """
+    keys = np.zeros(len(df), dtype=np.int64)
+    valid = np.ones(len(df), dtype=bool)
+    cardinalities = []
+    uniques_per_column = []
+    key_space = 1
+
+    for column in group_by_columns:
+        codes, uniques = pd.factorize(df[column], sort=True)
+        key_space *= max(len(uniques), 1)
+        if key_space > np.iinfo(np.int64).max:
+            return None
+
+        valid &= codes >= 0
+        keys = keys * len(uniques) + codes
+        cardinalities.append(len(uniques))
+        uniques_per_column.append(uniques)
+
+    return keys[valid], np.array(cardinalities, dtype=np.int64), uniques_per_column
+
+
+# Parallel group-count kernel, built on the first 'numba' aggregation so DAG parsing
+# never imports numba; False once numba is known to be missing
+_group_count_numba = None
+
+
+def _get_group_count_numba() -> Optional[Callable[[np.ndarray, int], np.ndarray]]:
+    """
+    Import numba and compile the parallel group-count kernel on first use
+
+    Returns:
+        Function counting rows per dense group id, or None if numba is not installed
+    """
+    global _group_count_numba
+    if _group_count_numba is None:
+        try:
+            from numba import njit, prange, get_num_threads
+        except ImportError:
+            _group_count_numba = False
+            return None
+
+        @njit(parallel=True, cache=True)
+        def count_kernel(group_ids: np.ndarray, n_groups: int, n_chunks: int) -> np.ndarray:
+            # One histogram per chunk, summed at the end, so no two threads share a counter
+            chunk_size = (len(group_ids) + n_chunks - 1) // n_chunks
+            local_counts = np.zeros((n_chunks, n_groups), dtype=np.int64)
+            for chunk in prange(n_chunks):
+                start = chunk * chunk_size
+                stop = min(start + chunk_size, len(group_ids))
+                for i in range(start, stop):
+                    local_counts[chunk, group_ids[i]] += 1
+            return local_counts.sum(axis=0)
+
+        def group_count(group_ids: np.ndarray, n_groups: int) -> np.ndarray:
+            return count_kernel(group_ids, n_groups, get_num_threads())
+
+        _group_count_numba = group_count
+    return _group_count_numba or None
+
+
 def create_aggregation(df: pd.DataFrame, group_by_columns: List[str],
-                       count_column_name: str = "count") -> pd.DataFrame:
+                       count_column_name: str = "count", engine: str = AGGREGATION_ENGINE) -> pd.DataFrame:
     """
     Create an aggregation by grouping and counting
 
+    The default 'numpy' engine integer-encodes the group keys and counts them with
+    np.bincount; the 'numba' engine counts the same keys with a parallel kernel
+    (numba is imported and the kernel compiled on first use, then cached on disk).
+    Both match groupby(...).size() (sorted keys, null keys dropped).
+
     Args:
         df: DataFrame to aggregate
         group_by_columns: Columns to group by
         count_column_name: Name for the count column
+        engine: Group-by engine, 'numpy', 'cython' or 'numba'
         
     Returns:
         Aggregated DataFrame
     """
-    return df.groupby(group_by_columns).size().reset_index(name=count_column_name)
+    group_count_numba = _get_group_count_numba() if engine == 'numba' else None
+    if engine == 'numba' and group_count_numba is None:
+        logger.warning("numba is not installed, falling back to the numpy group-by engine")
+        engine = 'numpy'
+
+    encoded = _factorize_groups(df, group_by_columns) if engine != 'cython' else None
+    if encoded is None:
+        # observed=True keeps categorical keys from expanding to every category combination
+        return df.groupby(group_by_columns, observed=True).size().reset_index(name=count_column_name)
+
+    keys, cardinalities, uniques_per_column = encoded
+    group_ids, group_keys = pd.factorize(keys, sort=True)
+    if engine == 'numba':
+        counts = group_count_numba(group_ids, len(group_keys))
+    else:
+        counts = np.bincount(group_ids, minlength=len(group_keys))
+
+    columns = {}
+    remainder = group_keys
+    for column, cardinality, uniques in reversed(list(zip(group_by_columns, cardinalities,
+                                                            uniques_per_column))):
+        remainder, codes = np.divmod(remainder, cardinality)
+        columns[column] = uniques.take(codes)
+
+    result = pd.DataFrame({column: columns[column] for column in group_by_columns})
+    result[count_column_name] = counts
+    return result
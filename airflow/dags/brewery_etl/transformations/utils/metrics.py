@@ -1,9 +1,20 @@
 """Helper functions for ETL process metrics."""
 
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from prometheus_client import Counter, Gauge, Histogram, Summary, CollectorRegistry, push_to_gateway
 
+logger = logging.getLogger(__name__)
+
 PUSHGATEWAY_HOST = 'pushgateway:9091'
+PUSHGATEWAY_TIMEOUT = 30
+PUSH_METRICS_TIMEOUT = 2
+
+# Single worker so pushes from the same process stay ordered. A push still running
+# when the task process ends is lost: Airflow's forking task runner exits with
+# os._exit, which does not wait for this thread.
+_push_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='metrics-push')
 
 class PrometheusMetrics:
     """
@@ -19,6 +30,7 @@ class PrometheusMetrics:
         """Initialize metrics with service name as prefix"""
         self.service_name = service_name
         self.registry = CollectorRegistry()
+        self._registered_metrics = {}
 
         self.operations_total = Counter(
             f'{service_name}_operations_total',
@@ -48,6 +60,13 @@ class PrometheusMetrics:
             registry=self.registry
         )
 
+        self.delta_write_duration_seconds = Histogram(
+            f'{service_name}_delta_write_duration_seconds',
+            'Time taken to write to Delta format',
+            ['operation', 'layer'],
+            registry=self.registry
+        )
+
         self._initialize_metrics()
 
     def _initialize_metrics(self):
@@ -64,12 +83,17 @@ class PrometheusMetrics:
 
 
     def push_metrics(self, job_name):
+        """Push metrics to Prometheus Pushgateway in a background thread"""
+        return _push_executor.submit(self._push_metrics, job_name)
+
+    def _push_metrics(self, job_name):
         """Push metrics to Prometheus Pushgateway"""
         try:
-            push_to_gateway(PUSHGATEWAY_HOST, job=job_name, registry=self.registry)
+            push_to_gateway(PUSHGATEWAY_HOST, job=job_name, registry=self.registry,
+                            timeout=PUSHGATEWAY_TIMEOUT)
             return True
         except Exception as e:
-            print(f"Failed to push metrics to Prometheus: {e}")
+            logger.error("Failed to push metrics to Prometheus: %s", e)
             return False
 
 
@@ -77,19 +101,22 @@ class PrometheusMetrics:
         """Register a new metric with the registry"""
         labels = labels or []
 
-        for metric in self.registry._names_to_collectors.values():
-            if metric._name == name:
-                return metric
+        if name in self._registered_metrics:
+            return self._registered_metrics[name]
 
         if metric_type == 'counter':
-            return Counter(name, description, labels, registry=self.registry)
+            metric = Counter(name, description, labels, registry=self.registry)
         elif metric_type == 'gauge':
-            return Gauge(name, description, labels, registry=self.registry)
+            metric = Gauge(name, description, labels, registry=self.registry)
         elif metric_type == 'histogram':
-            return Histogram(name, description, labels, registry=self.registry)
+            metric = Histogram(name, description, labels, registry=self.registry)
         elif metric_type == 'summary':
-            return Summary(name, description, labels, registry=self.registry)
-        raise ValueError(f"Unknown metric type: {metric_type}")
+            metric = Summary(name, description, labels, registry=self.registry)
+        else:
+            raise ValueError(f"Unknown metric type: {metric_type}")
+
+        self._registered_metrics[name] = metric
+        return metric
 
 
 class ETLMetricsContext:
@@ -102,11 +129,11 @@ class ETLMetricsContext:
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self.metrics
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = (time.perf_counter_ns() - self.start_time) / 1e9
 
         if exc_type is not None:
             self.metrics.operations_total.labels(operation=self.operation, status='failure').inc()
@@ -121,7 +148,15 @@ class ETLMetricsContext:
             'task', {}).task_id if hasattr(self.kwargs.get('task', {}), 'task_id') else 'unknown_task'
 
         job_name = f'{dag_id}_{task_id}'
-        self.metrics.push_metrics(job_name)
+        # Failed runs wait for the push to finish so their failure metrics are not
+        # lost; successful runs wait briefly and may drop a push that is still slow
+        push = self.metrics.push_metrics(job_name)
+        wait_timeout = PUSHGATEWAY_TIMEOUT if exc_type is not None else PUSH_METRICS_TIMEOUT
+        try:
+            push.result(timeout=wait_timeout)
+        except FutureTimeoutError:
+            logger.warning("Metrics push for %s still running after %ss, "
+                           "it may be lost when the task process exits", job_name, wait_timeout)
 
         return False
 
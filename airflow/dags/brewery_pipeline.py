@@ -27,6 +27,7 @@ dag = DAG(
     start_date=datetime(2025, 6, 8),
     catchup=False,
     tags=['brewery', 'etl', 'medallion'],
+    params={'full_refresh': False},
 )
 
 extract_task = PythonOperator(